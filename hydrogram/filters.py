@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import inspect
 import re
+from functools import lru_cache
 from re import Pattern
 from typing import Callable
 
@@ -37,6 +38,21 @@ from hydrogram.types import (
 
 
 class Filter:
+    __slots__ = ()
+
+    # Whether __call__ is a coroutine function. Classes generated by create()
+    # set this at construction time so combinators can read it without
+    # introspection; None means "unknown, fall back to inspect once".
+    _is_async = None
+
+    # Relative evaluation cost, used to order children in boolean compositions.
+    # Built-in attribute-read predicates are 1; anything else defaults to 10.
+    COST = 10
+
+    # True for filters with no observable side effects, meaning combinators may
+    # freely reorder them around their siblings.
+    PURE = False
+
     async def __call__(self, client: hydrogram.Client, update: Update):
         raise NotImplementedError
 
@@ -44,74 +60,247 @@ class Filter:
         return InvertFilter(self)
 
     def __and__(self, other):
-        return AndFilter(self, other)
+        return AllFilter([self, other])
 
     def __or__(self, other):
-        return OrFilter(self, other)
+        return AnyFilter([self, other])
 
 
 class InvertFilter(Filter):
+    __slots__ = ("_base_async", "_base_fast", "base")
+
     def __init__(self, base):
         self.base = base
+        # Whether a filter is a coroutine is fixed at construction time, so
+        # check it once here instead of on every update.
+        self._base_async = _is_async_filter(base)
+        # Built-in predicate filters (FAST_SYNC) are cheaper than the executor
+        # submission itself, so they are called inline in the event loop thread.
+        self._base_fast = not self._base_async and getattr(base, "FAST_SYNC", False)
 
     async def __call__(self, client: hydrogram.Client, update: Update):
-        if inspect.iscoroutinefunction(self.base.__call__):
+        if self._base_async:
             x = await self.base(client, update)
+        elif self._base_fast:
+            x = self.base(client, update)
         else:
-            x = await client.loop.run_in_executor(client.executor, self.base, client, update)
+            x = await client.loop.run_in_executor(None, self.base, client, update)
 
         return not x
 
 
 class AndFilter(Filter):
+    __slots__ = ("_base_async", "_base_fast", "_other_async", "_other_fast", "base", "other")
+
     def __init__(self, base, other):
         self.base = base
         self.other = other
+        self._base_async = _is_async_filter(base)
+        self._other_async = _is_async_filter(other)
+        self._base_fast = not self._base_async and getattr(base, "FAST_SYNC", False)
+        self._other_fast = not self._other_async and getattr(other, "FAST_SYNC", False)
 
     async def __call__(self, client: hydrogram.Client, update: Update):
-        if inspect.iscoroutinefunction(self.base.__call__):
+        if self._base_async:
             x = await self.base(client, update)
+        elif self._base_fast:
+            x = self.base(client, update)
         else:
-            x = await client.loop.run_in_executor(client.executor, self.base, client, update)
+            x = await client.loop.run_in_executor(None, self.base, client, update)
 
         # short circuit
         if not x:
             return False
 
-        if inspect.iscoroutinefunction(self.other.__call__):
+        if self._other_async:
             y = await self.other(client, update)
+        elif self._other_fast:
+            y = self.other(client, update)
         else:
-            y = await client.loop.run_in_executor(client.executor, self.other, client, update)
+            y = await client.loop.run_in_executor(None, self.other, client, update)
 
         return x and y
 
 
 class OrFilter(Filter):
+    __slots__ = ("_base_async", "_base_fast", "_other_async", "_other_fast", "base", "other")
+
     def __init__(self, base, other):
         self.base = base
         self.other = other
+        self._base_async = _is_async_filter(base)
+        self._other_async = _is_async_filter(other)
+        self._base_fast = not self._base_async and getattr(base, "FAST_SYNC", False)
+        self._other_fast = not self._other_async and getattr(other, "FAST_SYNC", False)
 
     async def __call__(self, client: hydrogram.Client, update: Update):
-        if inspect.iscoroutinefunction(self.base.__call__):
+        if self._base_async:
             x = await self.base(client, update)
+        elif self._base_fast:
+            x = self.base(client, update)
         else:
-            x = await client.loop.run_in_executor(client.executor, self.base, client, update)
+            x = await client.loop.run_in_executor(None, self.base, client, update)
 
         # short circuit
         if x:
             return True
 
-        if inspect.iscoroutinefunction(self.other.__call__):
+        if self._other_async:
             y = await self.other(client, update)
+        elif self._other_fast:
+            y = self.other(client, update)
         else:
-            y = await client.loop.run_in_executor(client.executor, self.other, client, update)
+            y = await client.loop.run_in_executor(None, self.other, client, update)
 
         return x or y
 
 
+def _is_async_filter(f: Filter) -> bool:
+    is_async = getattr(f, "_is_async", None)
+
+    if is_async is None:
+        is_async = inspect.iscoroutinefunction(f.__call__)
+
+    return is_async
+
+
+def _child_meta(child: Filter) -> tuple[Filter, bool, bool]:
+    is_async = _is_async_filter(child)
+    return child, is_async, not is_async and getattr(child, "FAST_SYNC", False)
+
+
+def _order_children(children: list[Filter]) -> list[Filter]:
+    """Run cheap filters first to raise the short-circuit probability.
+
+    Only side-effect-free filters (PURE) are promoted; the rest keep their
+    original relative order, after the pure ones. Safe for conjunctions only:
+    every child still runs unless the whole composition already failed.
+    """
+    pure = [c for c in children if getattr(c, "PURE", False)]
+
+    if not pure:
+        return children
+
+    impure = [c for c in children if not getattr(c, "PURE", False)]
+    pure.sort(key=lambda c: getattr(c, "COST", 10))
+
+    return [*pure, *impure]
+
+
+def _all_pure(children: list[Filter]) -> bool:
+    for c in children:
+        if not getattr(c, "PURE", False):
+            return False
+
+    return True
+
+
+class AllFilter(Filter):
+    """Flat N-ary conjunction built by chaining filters with ``&``.
+
+    Keeping the children in a single list avoids the left-leaning tree of
+    nested two-filter nodes (and one coroutine frame per level) that
+    ``a & b & c & d`` would otherwise produce.
+    """
+
+    __slots__ = ("_meta", "children")
+
+    def __init__(self, children: list[Filter]):
+        self.children = children
+        self._meta = [_child_meta(child) for child in _order_children(children)]
+
+    def __and__(self, other):
+        return AllFilter([*self.children, other])
+
+    async def __call__(self, client: hydrogram.Client, update: Update):
+        for child, is_async, is_fast in self._meta:
+            if is_async:
+                x = await child(client, update)
+            elif is_fast:
+                x = child(client, update)
+            else:
+                x = await client.loop.run_in_executor(None, child, client, update)
+
+            # short circuit
+            if not x:
+                return False
+
+        return True
+
+
+class AnyFilter(Filter):
+    """Flat N-ary disjunction built by chaining filters with ``|``."""
+
+    __slots__ = ("_meta", "children")
+
+    def __init__(self, children: list[Filter]):
+        self.children = children
+        # The first truthy child ends a disjunction, so promoting a pure
+        # sibling past an impure one (e.g. command(), which writes
+        # message.command) would skip the impure child's side effects for the
+        # very update the handler then receives. Reorder only when every
+        # child is side-effect-free.
+        ordered = _order_children(children) if _all_pure(children) else children
+        self._meta = [_child_meta(child) for child in ordered]
+
+    def __or__(self, other):
+        return AnyFilter([*self.children, other])
+
+    async def __call__(self, client: hydrogram.Client, update: Update):
+        for child, is_async, is_fast in self._meta:
+            if is_async:
+                x = await child(client, update)
+            elif is_fast:
+                x = child(client, update)
+            else:
+                x = await client.loop.run_in_executor(None, child, client, update)
+
+            # short circuit
+            if x:
+                return True
+
+        return False
+
+
+class _AttrFilter(Filter):
+    """Filter that passes when the given message attribute is set and truthy.
+
+    Covers the many built-in filters of the form ``bool(m.<attr>)`` with a
+    single class instead of one generated class and function object each.
+    """
+
+    __slots__ = ("attr",)
+
+    COST = 1
+    PURE = True
+
+    def __init__(self, attr: str):
+        self.attr = attr
+
+    async def __call__(self, client: hydrogram.Client, m: Message):
+        return bool(getattr(m, self.attr, None))
+
+
 CUSTOM_FILTER_NAME = "CustomFilter"
 
 
+def _build_filter(func: Callable, name: str | None, kwargs: dict) -> Filter:
+    return type(
+        name or func.__name__ or CUSTOM_FILTER_NAME,
+        (Filter,),
+        {
+            "__call__": func,
+            "_is_async": inspect.iscoroutinefunction(func),
+            **kwargs,
+        },
+    )()
+
+
+@lru_cache(maxsize=256)
+def _cached_filter(func: Callable, name: str | None, kwargs_items: tuple) -> Filter:
+    return _build_filter(func, name, dict(kwargs_items))
+
+
 def create(func: Callable, name: str | None = None, **kwargs) -> Filter:
     """Easily create a custom filter.
 
@@ -135,11 +324,16 @@ def create(func: Callable, name: str | None = None, **kwargs) -> Filter:
             Any keyword argument you would like to pass. Useful when creating parameterized custom filters, such as
             :meth:`~hydrogram.filters.command` or :meth:`~hydrogram.filters.regex`.
     """
-    return type(
-        name or func.__name__ or CUSTOM_FILTER_NAME,
-        (Filter,),
-        {"__call__": func, **kwargs},
-    )()
+    # Filters are frequently recreated with identical arguments across handler
+    # modules; when everything is hashable, share one instance instead of
+    # building a fresh class each time.
+    try:
+        kwargs_items = tuple(sorted(kwargs.items()))
+        hash((func, name, kwargs_items))
+    except TypeError:
+        return _build_filter(func, name, kwargs)
+
+    return _cached_filter(func, name, kwargs_items)
 
 
 # region all_filter
@@ -147,7 +341,7 @@ def all_filter(_, __, ___):
     return True
 
 
-all = create(all_filter)
+all = create(all_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter all messages."""
 
 
@@ -156,10 +350,11 @@ all = create(all_filter)
 
 # region me_filter
 def me_filter(_, __, m: Message):
-    return bool(m.from_user.is_self if m.from_user else getattr(m, "outgoing", False))
+    fu = m.from_user
+    return bool(fu.is_self if fu is not None else m.outgoing)
 
 
-me = create(me_filter)
+me = create(me_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter messages generated by you yourself."""
 
 
@@ -171,7 +366,7 @@ def bot_filter(_, __, m: Message):
     return bool(m.from_user and m.from_user.is_bot)
 
 
-bot = create(bot_filter)
+bot = create(bot_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter messages coming from bots."""
 
 
@@ -183,7 +378,7 @@ def incoming_filter(_, __, m: Message):
     return not m.outgoing
 
 
-incoming = create(incoming_filter)
+incoming = create(incoming_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter incoming messages. Messages sent to your own chat (Saved Messages) are also recognised as incoming."""
 
 
@@ -195,7 +390,7 @@ def outgoing_filter(_, __, m: Message):
     return m.outgoing
 
 
-outgoing = create(outgoing_filter)
+outgoing = create(outgoing_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter outgoing messages. Messages sent to your own chat (Saved Messages) are not recognized as outgoing."""
 
 
@@ -203,11 +398,7 @@ outgoing = create(outgoing_filter)
 
 
 # region text_filter
-def text_filter(_, __, m: Message):
-    return bool(m.text)
-
-
-text = create(text_filter)
+text = _AttrFilter("text")
 """Filter text messages."""
 
 
@@ -215,11 +406,7 @@ text = create(text_filter)
 
 
 # region reply_filter
-def reply_filter(_, __, m: Message):
-    return bool(m.reply_to_message_id)
-
-
-reply = create(reply_filter)
+reply = _AttrFilter("reply_to_message_id")
 """Filter messages that are replies to other messages."""
 
 
@@ -227,11 +414,7 @@ reply = create(reply_filter)
 
 
 # region forwarded_filter
-def forwarded_filter(_, __, m: Message):
-    return bool(m.forward_date)
-
-
-forwarded = create(forwarded_filter)
+forwarded = _AttrFilter("forward_date")
 """Filter messages that are forwarded."""
 
 
@@ -239,11 +422,7 @@ forwarded = create(forwarded_filter)
 
 
 # region caption_filter
-def caption_filter(_, __, m: Message):
-    return bool(m.caption)
-
-
-caption = create(caption_filter)
+caption = _AttrFilter("caption")
 """Filter media messages that contain captions."""
 
 
@@ -251,11 +430,7 @@ caption = create(caption_filter)
 
 
 # region audio_filter
-def audio_filter(_, __, m: Message):
-    return bool(m.audio)
-
-
-audio = create(audio_filter)
+audio = _AttrFilter("audio")
 """Filter messages that contain :obj:`~hydrogram.types.Audio` objects."""
 
 
@@ -263,11 +438,7 @@ audio = create(audio_filter)
 
 
 # region document_filter
-def document_filter(_, __, m: Message):
-    return bool(m.document)
-
-
-document = create(document_filter)
+document = _AttrFilter("document")
 """Filter messages that contain :obj:`~hydrogram.types.Document` objects."""
 
 
@@ -275,11 +446,7 @@ document = create(document_filter)
 
 
 # region photo_filter
-def photo_filter(_, __, m: Message):
-    return bool(m.photo)
-
-
-photo = create(photo_filter)
+photo = _AttrFilter("photo")
 """Filter messages that contain :obj:`~hydrogram.types.Photo` objects."""
 
 
@@ -287,11 +454,7 @@ photo = create(photo_filter)
 
 
 # region sticker_filter
-def sticker_filter(_, __, m: Message):
-    return bool(m.sticker)
-
-
-sticker = create(sticker_filter)
+sticker = _AttrFilter("sticker")
 """Filter messages that contain :obj:`~hydrogram.types.Sticker` objects."""
 
 
@@ -299,11 +462,7 @@ sticker = create(sticker_filter)
 
 
 # region animation_filter
-def animation_filter(_, __, m: Message):
-    return bool(m.animation)
-
-
-animation = create(animation_filter)
+animation = _AttrFilter("animation")
 """Filter messages that contain :obj:`~hydrogram.types.Animation` objects."""
 
 
@@ -311,11 +470,7 @@ animation = create(animation_filter)
 
 
 # region game_filter
-def game_filter(_, __, m: Message):
-    return bool(m.game)
-
-
-game = create(game_filter)
+game = _AttrFilter("game")
 """Filter messages that contain :obj:`~hydrogram.types.Game` objects."""
 
 
@@ -323,11 +478,7 @@ game = create(game_filter)
 
 
 # region video_filter
-def video_filter(_, __, m: Message):
-    return bool(m.video)
-
-
-video = create(video_filter)
+video = _AttrFilter("video")
 """Filter messages that contain :obj:`~hydrogram.types.Video` objects."""
 
 
@@ -335,11 +486,7 @@ video = create(video_filter)
 
 
 # region media_group_filter
-def media_group_filter(_, __, m: Message):
-    return bool(m.media_group_id)
-
-
-media_group = create(media_group_filter)
+media_group = _AttrFilter("media_group_id")
 """Filter messages containing photos or videos being part of an album."""
 
 
@@ -347,11 +494,7 @@ media_group = create(media_group_filter)
 
 
 # region voice_filter
-def voice_filter(_, __, m: Message):
-    return bool(m.voice)
-
-
-voice = create(voice_filter)
+voice = _AttrFilter("voice")
 """Filter messages that contain :obj:`~hydrogram.types.Voice` note objects."""
 
 
@@ -359,11 +502,7 @@ voice = create(voice_filter)
 
 
 # region video_note_filter
-def video_note_filter(_, __, m: Message):
-    return bool(m.video_note)
-
-
-video_note = create(video_note_filter)
+video_note = _AttrFilter("video_note")
 """Filter messages that contain :obj:`~hydrogram.types.VideoNote` objects."""
 
 
@@ -371,11 +510,7 @@ video_note = create(video_note_filter)
 
 
 # region contact_filter
-def contact_filter(_, __, m: Message):
-    return bool(m.contact)
-
-
-contact = create(contact_filter)
+contact = _AttrFilter("contact")
 """Filter messages that contain :obj:`~hydrogram.types.Contact` objects."""
 
 
@@ -383,11 +518,7 @@ contact = create(contact_filter)
 
 
 # region location_filter
-def location_filter(_, __, m: Message):
-    return bool(m.location)
-
-
-location = create(location_filter)
+location = _AttrFilter("location")
 """Filter messages that contain :obj:`~hydrogram.types.Location` objects."""
 
 
@@ -395,11 +526,7 @@ location = create(location_filter)
 
 
 # region venue_filter
-def venue_filter(_, __, m: Message):
-    return bool(m.venue)
-
-
-venue = create(venue_filter)
+venue = _AttrFilter("venue")
 """Filter messages that contain :obj:`~hydrogram.types.Venue` objects."""
 
 
@@ -407,11 +534,7 @@ venue = create(venue_filter)
 
 
 # region web_page_filter
-def web_page_filter(_, __, m: Message):
-    return bool(m.web_page)
-
-
-web_page = create(web_page_filter)
+web_page = _AttrFilter("web_page")
 """Filter messages sent with a webpage preview."""
 
 
@@ -419,11 +542,7 @@ web_page = create(web_page_filter)
 
 
 # region poll_filter
-def poll_filter(_, __, m: Message):
-    return bool(m.poll)
-
-
-poll = create(poll_filter)
+poll = _AttrFilter("poll")
 """Filter messages that contain :obj:`~hydrogram.types.Poll` objects."""
 
 
@@ -431,11 +550,7 @@ poll = create(poll_filter)
 
 
 # region dice_filter
-def dice_filter(_, __, m: Message):
-    return bool(m.dice)
-
-
-dice = create(dice_filter)
+dice = _AttrFilter("dice")
 """Filter messages that contain :obj:`~hydrogram.types.Dice` objects."""
 
 
@@ -443,29 +558,46 @@ dice = create(dice_filter)
 
 
 # region media_spoiler
-def media_spoiler_filter(_, __, m: Message):
-    return bool(m.has_media_spoiler)
-
-
-media_spoiler = create(media_spoiler_filter)
+media_spoiler = _AttrFilter("has_media_spoiler")
 """Filter media messages that contain a spoiler."""
 
 
 # endregion
 
 
+# Looked up once at import time: identity compares against these beat building
+# a set literal and hashing the enum member on every call.
+_CHAT_TYPE_PRIVATE = enums.ChatType.PRIVATE
+_CHAT_TYPE_BOT = enums.ChatType.BOT
+_CHAT_TYPE_GROUP = enums.ChatType.GROUP
+_CHAT_TYPE_SUPERGROUP = enums.ChatType.SUPERGROUP
+_CHAT_TYPE_CHANNEL = enums.ChatType.CHANNEL
+
+
+def _update_chat(m: CallbackQuery | Message, filter_name: str):
+    try:
+        return m.chat
+    except AttributeError:
+        pass
+
+    try:
+        return m.message.chat
+    except AttributeError:
+        raise ValueError(f"{filter_name} filter doesn't work with {type(m)}") from None
+
+
 # region private_filter
 def private_filter(_, __, m: CallbackQuery | Message):
-    if isinstance(m, Message):
-        value = m.chat
-    elif isinstance(m, CallbackQuery):
-        value = m.message.chat
-    else:
-        raise ValueError(f"Private filter doesn't work with {type(m)}")
-    return bool(value and value.type in {enums.ChatType.PRIVATE, enums.ChatType.BOT})
+    chat = _update_chat(m, "Private")
+
+    if chat is None:
+        return False
+
+    t = chat.type
+    return t is _CHAT_TYPE_PRIVATE or t is _CHAT_TYPE_BOT
 
 
-private = create(private_filter)
+private = create(private_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter messages sent in private chats."""
 
 
@@ -474,16 +606,16 @@ private = create(private_filter)
 
 # region group_filter
 def group_filter(_, __, m: CallbackQuery | Message):
-    if isinstance(m, Message):
-        value = m.chat
-    elif isinstance(m, CallbackQuery):
-        value = m.message.chat
-    else:
-        raise ValueError(f"Group filter doesn't work with {type(m)}")
-    return bool(value and value.type in {enums.ChatType.GROUP, enums.ChatType.SUPERGROUP})
+    chat = _update_chat(m, "Group")
+
+    if chat is None:
+        return False
+
+    t = chat.type
+    return t is _CHAT_TYPE_GROUP or t is _CHAT_TYPE_SUPERGROUP
 
 
-group = create(group_filter)
+group = create(group_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter messages sent in group or supergroup chats."""
 
 
@@ -492,16 +624,11 @@ group = create(group_filter)
 
 # region channel_filter
 def channel_filter(_, __, m: CallbackQuery | Message):
-    if isinstance(m, Message):
-        value = m.chat
-    elif isinstance(m, CallbackQuery):
-        value = m.message.chat
-    else:
-        raise ValueError(f"Channel filter doesn't work with {type(m)}")
-    return bool(value and value.type == enums.ChatType.CHANNEL)
+    chat = _update_chat(m, "Channel")
+    return chat is not None and chat.type is _CHAT_TYPE_CHANNEL
 
 
-channel = create(channel_filter)
+channel = create(channel_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter messages sent in channels."""
 
 
@@ -509,11 +636,7 @@ channel = create(channel_filter)
 
 
 # region new_chat_members_filter
-def new_chat_members_filter(_, __, m: Message):
-    return bool(m.new_chat_members)
-
-
-new_chat_members = create(new_chat_members_filter)
+new_chat_members = _AttrFilter("new_chat_members")
 """Filter service messages for new chat members."""
 
 
@@ -521,11 +644,7 @@ new_chat_members = create(new_chat_members_filter)
 
 
 # region left_chat_member_filter
-def left_chat_member_filter(_, __, m: Message):
-    return bool(m.left_chat_member)
-
-
-left_chat_member = create(left_chat_member_filter)
+left_chat_member = _AttrFilter("left_chat_member")
 """Filter service messages for members that left the chat."""
 
 
@@ -533,11 +652,7 @@ left_chat_member = create(left_chat_member_filter)
 
 
 # region new_chat_title_filter
-def new_chat_title_filter(_, __, m: Message):
-    return bool(m.new_chat_title)
-
-
-new_chat_title = create(new_chat_title_filter)
+new_chat_title = _AttrFilter("new_chat_title")
 """Filter service messages for new chat titles."""
 
 
@@ -545,11 +660,7 @@ new_chat_title = create(new_chat_title_filter)
 
 
 # region new_chat_photo_filter
-def new_chat_photo_filter(_, __, m: Message):
-    return bool(m.new_chat_photo)
-
-
-new_chat_photo = create(new_chat_photo_filter)
+new_chat_photo = _AttrFilter("new_chat_photo")
 """Filter service messages for new chat photos."""
 
 
@@ -557,11 +668,7 @@ new_chat_photo = create(new_chat_photo_filter)
 
 
 # region delete_chat_photo_filter
-def delete_chat_photo_filter(_, __, m: Message):
-    return bool(m.delete_chat_photo)
-
-
-delete_chat_photo = create(delete_chat_photo_filter)
+delete_chat_photo = _AttrFilter("delete_chat_photo")
 """Filter service messages for deleted photos."""
 
 
@@ -569,11 +676,7 @@ delete_chat_photo = create(delete_chat_photo_filter)
 
 
 # region group_chat_created_filter
-def group_chat_created_filter(_, __, m: Message):
-    return bool(m.group_chat_created)
-
-
-group_chat_created = create(group_chat_created_filter)
+group_chat_created = _AttrFilter("group_chat_created")
 """Filter service messages for group chat creations."""
 
 
@@ -581,11 +684,7 @@ group_chat_created = create(group_chat_created_filter)
 
 
 # region supergroup_chat_created_filter
-def supergroup_chat_created_filter(_, __, m: Message):
-    return bool(m.supergroup_chat_created)
-
-
-supergroup_chat_created = create(supergroup_chat_created_filter)
+supergroup_chat_created = _AttrFilter("supergroup_chat_created")
 """Filter service messages for supergroup chat creations."""
 
 
@@ -593,11 +692,7 @@ supergroup_chat_created = create(supergroup_chat_created_filter)
 
 
 # region channel_chat_created_filter
-def channel_chat_created_filter(_, __, m: Message):
-    return bool(m.channel_chat_created)
-
-
-channel_chat_created = create(channel_chat_created_filter)
+channel_chat_created = _AttrFilter("channel_chat_created")
 """Filter service messages for channel chat creations."""
 
 
@@ -605,11 +700,7 @@ channel_chat_created = create(channel_chat_created_filter)
 
 
 # region migrate_to_chat_id_filter
-def migrate_to_chat_id_filter(_, __, m: Message):
-    return bool(m.migrate_to_chat_id)
-
-
-migrate_to_chat_id = create(migrate_to_chat_id_filter)
+migrate_to_chat_id = _AttrFilter("migrate_to_chat_id")
 """Filter service messages that contain migrate_to_chat_id."""
 
 
@@ -617,11 +708,7 @@ migrate_to_chat_id = create(migrate_to_chat_id_filter)
 
 
 # region migrate_from_chat_id_filter
-def migrate_from_chat_id_filter(_, __, m: Message):
-    return bool(m.migrate_from_chat_id)
-
-
-migrate_from_chat_id = create(migrate_from_chat_id_filter)
+migrate_from_chat_id = _AttrFilter("migrate_from_chat_id")
 """Filter service messages that contain migrate_from_chat_id."""
 
 
@@ -629,11 +716,7 @@ migrate_from_chat_id = create(migrate_from_chat_id_filter)
 
 
 # region pinned_message_filter
-def pinned_message_filter(_, __, m: Message):
-    return bool(m.pinned_message)
-
-
-pinned_message = create(pinned_message_filter)
+pinned_message = _AttrFilter("pinned_message")
 """Filter service messages for pinned messages."""
 
 
@@ -641,11 +724,7 @@ pinned_message = create(pinned_message_filter)
 
 
 # region game_high_score_filter
-def game_high_score_filter(_, __, m: Message):
-    return bool(m.game_high_score)
-
-
-game_high_score = create(game_high_score_filter)
+game_high_score = _AttrFilter("game_high_score")
 """Filter service messages for game high scores."""
 
 
@@ -657,7 +736,7 @@ def reply_keyboard_filter(_, __, m: Message):
     return isinstance(m.reply_markup, ReplyKeyboardMarkup)
 
 
-reply_keyboard = create(reply_keyboard_filter)
+reply_keyboard = create(reply_keyboard_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter messages containing reply keyboard markups"""
 
 
@@ -669,7 +748,7 @@ def inline_keyboard_filter(_, __, m: Message):
     return isinstance(m.reply_markup, InlineKeyboardMarkup)
 
 
-inline_keyboard = create(inline_keyboard_filter)
+inline_keyboard = create(inline_keyboard_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter messages containing inline keyboard markups"""
 
 
@@ -677,11 +756,7 @@ inline_keyboard = create(inline_keyboard_filter)
 
 
 # region mentioned_filter
-def mentioned_filter(_, __, m: Message):
-    return bool(m.mentioned)
-
-
-mentioned = create(mentioned_filter)
+mentioned = _AttrFilter("mentioned")
 """Filter messages containing mentions"""
 
 
@@ -689,11 +764,7 @@ mentioned = create(mentioned_filter)
 
 
 # region via_bot_filter
-def via_bot_filter(_, __, m: Message):
-    return bool(m.via_bot)
-
-
-via_bot = create(via_bot_filter)
+via_bot = _AttrFilter("via_bot")
 """Filter messages sent via inline bots"""
 
 
@@ -701,11 +772,7 @@ via_bot = create(via_bot_filter)
 
 
 # region video_chat_started_filter
-def video_chat_started_filter(_, __, m: Message):
-    return bool(m.video_chat_started)
-
-
-video_chat_started = create(video_chat_started_filter)
+video_chat_started = _AttrFilter("video_chat_started")
 """Filter messages for started video chats"""
 
 
@@ -713,11 +780,7 @@ video_chat_started = create(video_chat_started_filter)
 
 
 # region video_chat_ended_filter
-def video_chat_ended_filter(_, __, m: Message):
-    return bool(m.video_chat_ended)
-
-
-video_chat_ended = create(video_chat_ended_filter)
+video_chat_ended = _AttrFilter("video_chat_ended")
 """Filter messages for ended video chats"""
 
 
@@ -725,11 +788,7 @@ video_chat_ended = create(video_chat_ended_filter)
 
 
 # region video_chat_members_invited_filter
-def video_chat_members_invited_filter(_, __, m: Message):
-    return bool(m.video_chat_members_invited)
-
-
-video_chat_members_invited = create(video_chat_members_invited_filter)
+video_chat_members_invited = _AttrFilter("video_chat_members_invited")
 """Filter messages for voice chat invited members"""
 
 
@@ -737,11 +796,7 @@ video_chat_members_invited = create(video_chat_members_invited_filter)
 
 
 # region service_filter
-def service_filter(_, __, m: Message):
-    return bool(m.service)
-
-
-service = create(service_filter)
+service = _AttrFilter("service")
 """Filter service messages.
 
 A service message contains any of the following fields set: *left_chat_member*,
@@ -755,11 +810,7 @@ A service message contains any of the following fields set: *left_chat_member*,
 
 
 # region media_filter
-def media_filter(_, __, m: Message):
-    return bool(m.media)
-
-
-media = create(media_filter)
+media = _AttrFilter("media")
 """Filter media messages.
 
 A media message contains any of the following fields set: *audio*, *document*, *photo*, *sticker*, *video*,
@@ -771,11 +822,7 @@ A media message contains any of the following fields set: *audio*, *document*, *
 
 
 # region scheduled_filter
-def scheduled_filter(_, __, m: Message):
-    return bool(m.scheduled)
-
-
-scheduled = create(scheduled_filter)
+scheduled = _AttrFilter("scheduled")
 """Filter messages that have been scheduled (not yet sent)."""
 
 
@@ -783,11 +830,7 @@ scheduled = create(scheduled_filter)
 
 
 # region from_scheduled_filter
-def from_scheduled_filter(_, __, m: Message):
-    return bool(m.from_scheduled)
-
-
-from_scheduled = create(from_scheduled_filter)
+from_scheduled = _AttrFilter("from_scheduled")
 """Filter new automatically sent messages that were previously scheduled."""
 
 
@@ -799,7 +842,7 @@ def linked_channel_filter(_, __, m: Message):
     return bool(m.forward_from_chat and not m.from_user)
 
 
-linked_channel = create(linked_channel_filter)
+linked_channel = create(linked_channel_filter, FAST_SYNC=True, COST=1, PURE=True)
 """Filter messages that are automatically forwarded from the linked channel to the group chat."""
 
 
@@ -807,6 +850,127 @@ linked_channel = create(linked_channel_filter)
 
 
 # region command_filter
+# match.groups are 1-indexed, group(1) is the quote, group(2) is the text
+# between the quotes, group(3) is unquoted, whitespace-split text
+_COMMAND_TOKEN_RE = re.compile(r"([\"'])(.*?)(?<!\\)\1|(\S+)")
+
+# Removes the escape character in front of quotes inside arguments
+_COMMAND_ESCAPE_RE = re.compile(r"\\([\"'])")
+
+# Compiled per-command patterns, shared by every filter built from the same
+# commands/case-sensitivity pair. Keyed by (commands, case_sensitive, username).
+_command_patterns: dict[tuple[frozenset[str], bool, str], tuple] = {}
+
+# First-character prefix dispatch tables, keyed by the prefix set. None means
+# the empty prefix is allowed and every message is a candidate.
+_prefix_maps: dict[frozenset[str], dict[str, list[str]] | None] = {}
+
+
+def _prefix_map_for(prefixes: frozenset[str]) -> dict[str, list[str]] | None:
+    try:
+        return _prefix_maps[prefixes]
+    except KeyError:
+        pass
+
+    if "" in prefixes:
+        prefix_map = None
+    else:
+        prefix_map = {}
+        for p in prefixes:
+            prefix_map.setdefault(p[0], []).append(p)
+
+    _prefix_maps[prefixes] = prefix_map
+    return prefix_map
+
+
+def _command_filter(flt, client: hydrogram.Client, message: Message):
+    username = client.me.username or ""
+    text = message.text or message.caption
+
+    # message.command already defaults to None on the Message model, so
+    # it's only written on the success path below.
+    if not text:
+        return False
+
+    # The patterns only depend on the commands and the bot's username, which are
+    # fixed for the lifetime of the filter, so compile them once and reuse them.
+    cache_key = (flt.commands, flt.case_sensitive, username)
+    compiled = _command_patterns.get(cache_key)
+
+    if compiled is None:
+        # For the default configuration (case-insensitive, ASCII commands)
+        # match case-sensitive patterns against a lowercased copy of the
+        # text: cheaper than per-character case folding inside the regex
+        # engine. IGNORECASE patterns are kept as a fallback for the rare
+        # texts whose lowercased form changes length (e.g. "İ").
+        fold = not flt.case_sensitive and flt.ascii_commands and username.isascii()
+        flags = 0 if flt.case_sensitive or fold else re.IGNORECASE
+        username_re = re.escape(username.lower() if fold else username)
+        patterns = {
+            cmd: re.compile(rf"^{re.escape(cmd)}(?:@?{username_re})?(?:\s+|$)", flags)
+            for cmd in flt.commands
+        }
+        ci_patterns = (
+            {
+                cmd: re.compile(
+                    rf"^{re.escape(cmd)}(?:@?{re.escape(username)})?(?:\s+|$)",
+                    re.IGNORECASE,
+                )
+                for cmd in flt.commands
+            }
+            if fold
+            else patterns
+        )
+        compiled = _command_patterns[cache_key] = (fold, patterns, ci_patterns)
+
+    fold, patterns, ci_patterns = compiled
+    prefix_map = _prefix_map_for(flt.prefixes)
+
+    if prefix_map is None:
+        # The empty prefix is allowed: every message is a candidate
+        candidates = flt.prefixes
+    else:
+        candidates = prefix_map.get(text[0])
+
+        if candidates is None:
+            return False
+
+    for prefix in candidates:
+        if not text.startswith(prefix):
+            continue
+
+        without_prefix = text[len(prefix) :]
+        key = without_prefix
+        pats = patterns
+
+        if fold:
+            lowered = without_prefix.lower()
+
+            if len(lowered) == len(without_prefix):
+                key = lowered
+            else:
+                pats = ci_patterns
+
+        for cmd, pat in pats.items():
+            m = pat.match(key)
+
+            if m is None:
+                continue
+
+            # The match already consumed the command (and trailing
+            # whitespace), so the arguments start right at its end.
+            without_command = without_prefix[m.end() :]
+
+            message.command = [cmd] + [
+                _COMMAND_ESCAPE_RE.sub(r"\1", m.group(2) or m.group(3) or "")
+                for m in _COMMAND_TOKEN_RE.finditer(without_command)
+            ]
+
+            return True
+
+    return False
+
+
 def command(
     commands: str | list[str],
     prefixes: str | list[str] = "/",
@@ -830,70 +994,76 @@ def command(
             Pass True if you want your command(s) to be case sensitive. Defaults to False.
             Examples: when True, command="Start" would trigger /Start but not /start.
     """
-    command_re = re.compile(r"([\"'])(.*?)(?<!\\)\1|(\S+)")
-
-    def func(flt, client: hydrogram.Client, message: Message):
-        username = client.me.username or ""
-        text = message.text or message.caption
-        message.command = None
-
-        if not text:
-            return False
-
-        for prefix in flt.prefixes:
-            if not text.startswith(prefix):
-                continue
-
-            without_prefix = text[len(prefix) :]
-
-            for cmd in flt.commands:
-                if not re.match(
-                    rf"^(?:{cmd}(?:@?{username})?)(?:\s|$)",
-                    without_prefix,
-                    flags=0 if flt.case_sensitive else re.IGNORECASE,
-                ):
-                    continue
-
-                without_command = re.sub(
-                    rf"{cmd}(?:@?{username})?\s?",
-                    "",
-                    without_prefix,
-                    count=1,
-                    flags=0 if flt.case_sensitive else re.IGNORECASE,
-                )
-
-                # match.groups are 1-indexed, group(1) is the quote, group(2) is the text
-                # between the quotes, group(3) is unquoted, whitespace-split text
-
-                # Remove the escape character from the arguments
-                message.command = [cmd] + [
-                    re.sub(r"\\([\"'])", r"\1", m.group(2) or m.group(3) or "")
-                    for m in command_re.finditer(without_command)
-                ]
-
-                return True
-
-        return False
-
     commands = commands if isinstance(commands, list) else [commands]
-    commands = {c if case_sensitive else c.lower() for c in commands}
+    commands = frozenset(c if case_sensitive else c.lower() for c in commands)
+    ascii_commands = "".join(commands).isascii()
 
     prefixes = [] if prefixes is None else prefixes
     prefixes = prefixes if isinstance(prefixes, list) else [prefixes]
-    prefixes = set(prefixes) if prefixes else {""}
+    prefixes = frozenset(prefixes) if prefixes else frozenset({""})
 
     return create(
-        func,
+        _command_filter,
         "CommandFilter",
         commands=commands,
         prefixes=prefixes,
         case_sensitive=case_sensitive,
+        ascii_commands=ascii_commands,
     )
 
 
 # endregion
 
 
+_regex_cache: dict[tuple[str, int], Pattern] = {}
+_REGEX_CACHE_MAX_SIZE = 512
+
+
+def _compile_regex(pattern: str, flags: int) -> Pattern:
+    # Share compiled objects across filter instances, so that handler modules
+    # repeatedly creating filters from the same string don't recompile it.
+    key = (pattern, flags)
+    p = _regex_cache.get(key)
+
+    if p is None:
+        if len(_regex_cache) >= _REGEX_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del _regex_cache[next(iter(_regex_cache))]
+
+        p = _regex_cache[key] = re.compile(pattern, flags)
+
+    return p
+
+
+def _regex_filter(flt, _, update: Update):
+    if isinstance(update, Message):
+        value = update.text or update.caption
+    elif isinstance(update, CallbackQuery):
+        value = update.data
+    elif isinstance(update, InlineQuery):
+        value = update.query
+    else:
+        raise ValueError(f"Regex filter doesn't work with {type(update)}")
+
+    if value:
+        # A plain search is enough to reject non-matching updates (the vast
+        # majority) without materializing a list of matches for each one.
+        m = flt.p.search(value)
+
+        if m:
+            # Resuming at m.end() would re-find a zero-width first match at
+            # the same position, so rescan from the start in that case.
+            update.matches = (
+                list(flt.p.finditer(value))
+                if m.start() == m.end()
+                else [m, *flt.p.finditer(value, m.end())]
+            )
+            return True
+
+    update.matches = None
+    return False
+
+
 def regex(pattern: str | Pattern, flags: int = 0):
     """Filter updates that match a given regular expression pattern.
 
@@ -914,25 +1084,10 @@ def regex(pattern: str | Pattern, flags: int = 0):
             Regex flags.
     """
 
-    def func(flt, _, update: Update):
-        if isinstance(update, Message):
-            value = update.text or update.caption
-        elif isinstance(update, CallbackQuery):
-            value = update.data
-        elif isinstance(update, InlineQuery):
-            value = update.query
-        else:
-            raise ValueError(f"Regex filter doesn't work with {type(update)}")
-
-        if value:
-            update.matches = list(flt.p.finditer(value)) or None
-
-        return bool(update.matches)
-
     return create(
-        func,
+        _regex_filter,
         "RegexFilter",
-        p=pattern if isinstance(pattern, Pattern) else re.compile(pattern, flags),
+        p=pattern if isinstance(pattern, Pattern) else _compile_regex(pattern, flags),
     )
 
 
@@ -949,6 +1104,11 @@ class user(Filter, set):  # noqa: N801
             Defaults to None (no users).
     """
 
+    __slots__ = ()
+
+    COST = 1
+    PURE = True
+
     def __init__(self, users: int | str | list[int | str] | None = None):
         users = [] if users is None else users if isinstance(users, list) else [users]
 
@@ -958,11 +1118,22 @@ class user(Filter, set):  # noqa: N801
         )
 
     async def __call__(self, _, message: Message):
-        return message.from_user and (
-            message.from_user.id in self
-            or (message.from_user.username and message.from_user.username.lower() in self)
-            or ("me" in self and message.from_user.is_self)
-        )
+        mf = message.from_user
+
+        if not mf:
+            return False
+
+        # The numeric-id hit is the common case: try it first with a single probe
+        if mf.id in self:
+            return True
+
+        # Probed at call time because the container is mutable through the
+        # set bound methods advertised above.
+        if mf.is_self and "me" in self:
+            return True
+
+        u = mf.username
+        return u is not None and u.lower() in self
 
 
 class chat(Filter, set):  # noqa: N801
@@ -978,6 +1149,11 @@ class chat(Filter, set):  # noqa: N801
             Defaults to None (no chats).
     """
 
+    __slots__ = ()
+
+    COST = 1
+    PURE = True
+
     def __init__(self, chats: int | str | list[int | str] | None = None):
         chats = [] if chats is None else chats if isinstance(chats, list) else [chats]
 
@@ -987,13 +1163,20 @@ class chat(Filter, set):  # noqa: N801
         )
 
     async def __call__(self, _, message: Message):
-        return message.chat and (
-            message.chat.id in self
-            or (message.chat.username and message.chat.username.lower() in self)
-            or (
-                "me" in self
-                and message.from_user
-                and message.from_user.is_self
-                and not message.outgoing
-            )
-        )
+        mc = message.chat
+
+        if not mc:
+            return False
+
+        # The numeric-id hit is the common case: try it first with a single probe
+        if mc.id in self:
+            return True
+
+        u = mc.username
+        if u is not None and u.lower() in self:
+            return True
+
+        mf = message.from_user
+        # Probed at call time because the container is mutable through the
+        # set bound methods advertised above.
+        return bool(mf and mf.is_self and not message.outgoing and "me" in self)
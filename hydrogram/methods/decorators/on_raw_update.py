@@ -35,13 +35,12 @@ class OnRawUpdate:
         """
 
         def decorator(func: Callable) -> Callable:
+            handler = hydrogram.handlers.RawUpdateHandler(func)
+
             if isinstance(self, hydrogram.Client):
-                self.add_handler(hydrogram.handlers.RawUpdateHandler(func), group)
+                self.add_handler(handler, group)
             else:
-                if not hasattr(func, "handlers"):
-                    func.handlers = []
-
-                func.handlers.append((hydrogram.handlers.RawUpdateHandler(func), group))
+                func.__dict__.setdefault("handlers", []).append((handler, group))
 
             return func
 
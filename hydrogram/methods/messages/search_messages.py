@@ -19,6 +19,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 import hydrogram
@@ -29,33 +30,9 @@ if TYPE_CHECKING:
 
 
 async def get_chunk(
-    client,
-    chat_id: int | str,
-    query: str = "",
-    filter: enums.MessagesFilter = enums.MessagesFilter.EMPTY,
-    offset: int = 0,
-    limit: int = 100,
-    from_user: int | str | None = None,
-) -> list[types.Message]:
-    r = await client.invoke(
-        raw.functions.messages.Search(
-            peer=await client.resolve_peer(chat_id),
-            q=query,
-            filter=filter.value(),
-            min_date=0,
-            max_date=0,
-            offset_id=0,
-            add_offset=offset,
-            limit=limit,
-            min_id=0,
-            max_id=0,
-            from_id=(await client.resolve_peer(from_user) if from_user else None),
-            hash=0,
-        ),
-        sleep_threshold=60,
-    )
-
-    return await utils.parse_messages(client, r, replies=0)
+    client, search: raw.functions.messages.Search
+) -> raw.base.messages.Messages:
+    return await client.invoke(search, sleep_threshold=60)
 
 
 class SearchMessages:
@@ -124,30 +101,86 @@ class SearchMessages:
                     print(message.text)
         """
 
-        current = 0
-        total = abs(limit) or (1 << 31) - 1
-        limit = min(100, total)
-
-        while True:
-            messages = await get_chunk(
-                client=self,
-                chat_id=chat_id,
-                query=query,
-                filter=filter,
-                offset=offset,
-                limit=limit,
-                from_user=from_user,
+        remaining = abs(limit) or None
+        page_limit = min(100, remaining) if remaining else 100
+
+        # Both peers are invariant across the whole search: resolve them once
+        # instead of on every page, and concurrently, since either may need a
+        # ResolveUsername round trip when cold.
+        if from_user:
+            peer, from_id = await asyncio.gather(
+                self.resolve_peer(chat_id), self.resolve_peer(from_user)
             )
+        else:
+            peer = await self.resolve_peer(chat_id)
+            from_id = None
+
+        # Everything but add_offset and limit is invariant too, and the TL
+        # constructor is keyword-only, so build the query once and only touch
+        # the two paging fields on each round trip.
+        search = raw.functions.messages.Search(
+            peer=peer,
+            q=query,
+            filter=filter.value(),
+            min_date=0,
+            max_date=0,
+            offset_id=0,
+            add_offset=offset,
+            limit=page_limit,
+            min_id=0,
+            max_id=0,
+            from_id=from_id,
+            hash=0,
+        )
+
+        r = await get_chunk(self, search)
+
+        while r.messages:
+            page_len = len(r.messages)
+
+            # Count pages, not messages: the hot per-message path is then a
+            # bare yield, with the limit check hoisted to one slice per page.
+            if remaining is not None and page_len >= remaining:
+                r.messages = r.messages[:remaining]
+
+                async for message in utils.iter_parse_messages(self, r):
+                    yield message
 
-            if not messages:
                 return
 
-            offset += len(messages)
+            offset += page_len
+
+            # Ask the server for exactly what is still missing, and treat a
+            # short page as the end of the results: both spare a final round
+            # trip that would only return an empty (or truncated) page.
+            next_limit = min(100, remaining - page_len) if remaining is not None else 100
 
-            for message in messages:
-                yield message
+            # Start fetching the next page right away, so the server round trip
+            # overlaps with the caller consuming the current one. Mutating the
+            # shared query here is safe: the previous response already arrived,
+            # so nothing else is serializing it.
+            if page_len >= page_limit:
+                search.add_offset = offset
+                search.limit = next_limit
 
-                current += 1
+                prefetch = asyncio.create_task(get_chunk(self, search))
+            else:
+                prefetch = None
 
-                if current >= total:
+            try:
+                # Parse lazily while the prefetch is in flight: the first
+                # message is yielded after one parse, not after the whole page.
+                async for message in utils.iter_parse_messages(self, r):
+                    yield message
+
+                if remaining is not None:
+                    remaining -= page_len
+
+                if prefetch is None:
                     return
+
+                r = await prefetch
+                page_limit = next_limit
+            finally:
+                if prefetch is not None and not prefetch.done():
+                    prefetch.cancel()
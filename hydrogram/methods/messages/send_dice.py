@@ -27,6 +27,17 @@ from hydrogram import raw, types, utils
 if TYPE_CHECKING:
     from datetime import datetime
 
+_NEW_MESSAGE_TYPES = frozenset((
+    raw.types.UpdateNewMessage,
+    raw.types.UpdateNewChannelMessage,
+    raw.types.UpdateNewScheduledMessage,
+))
+
+# Only a handful of emoji are valid dice media and the TL object is immutable
+# once built (serialization just reads .emoticon), so share one instance per
+# emoji across calls.
+_dice_media_cache: dict[str, raw.types.InputMediaDice] = {}
+
 
 class SendDice:
     async def send_dice(
@@ -98,36 +109,43 @@ class SendDice:
                 await app.send_dice(chat_id, "🏀")
         """
 
-        reply_to = utils.get_reply_head_fm(message_thread_id, reply_to_message_id)
+        # The common bot path passes no reply or schedule options at all: skip
+        # the helper calls outright instead of having them branch on None.
+        reply_to = (
+            utils.get_reply_head_fm(message_thread_id, reply_to_message_id)
+            if message_thread_id is not None or reply_to_message_id is not None
+            else None
+        )
 
         r = await self.invoke(
             raw.functions.messages.SendMedia(
                 peer=await self.resolve_peer(chat_id),
-                media=raw.types.InputMediaDice(emoticon=emoji),
+                media=_dice_media_cache.get(emoji)
+                or _dice_media_cache.setdefault(emoji, raw.types.InputMediaDice(emoticon=emoji)),
                 silent=disable_notification or None,
                 reply_to=reply_to,
                 random_id=self.rnd_id(),
-                schedule_date=utils.datetime_to_timestamp(schedule_date),
+                schedule_date=utils.datetime_to_timestamp(schedule_date)
+                if schedule_date
+                else None,
                 noforwards=protect_content,
                 reply_markup=await reply_markup.write(self) if reply_markup else None,
                 message="",
             )
         )
 
+        users = {u.id: u for u in r.users}
+        chats = {c.id: c for c in r.chats}
+
         for i in r.updates:
-            if isinstance(
-                i,
-                (
-                    raw.types.UpdateNewMessage,
-                    raw.types.UpdateNewChannelMessage,
-                    raw.types.UpdateNewScheduledMessage,
-                ),
-            ):
+            t = type(i)
+
+            if t in _NEW_MESSAGE_TYPES:
                 return await types.Message._parse(
                     client=self,
                     message=i.message,
-                    users={i.id: i for i in r.users},
-                    chats={i.id: i for i in r.chats},
-                    is_scheduled=isinstance(i, raw.types.UpdateNewScheduledMessage),
+                    users=users,
+                    chats=chats,
+                    is_scheduled=t is raw.types.UpdateNewScheduledMessage,
                 )
         return None
@@ -54,6 +54,11 @@ class Start:
 
                 app.run(main())
         """
+        # Reuse the client's thread pool for every run_in_executor(None, ...)
+        # call on this loop, instead of letting asyncio lazily create its own
+        # (small) default executor next to it.
+        self.loop.set_default_executor(self.executor)
+
         is_authorized = await self.connect()
 
         try:
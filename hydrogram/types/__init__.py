@@ -17,242 +17,910 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-from .authorization import (
-    SentCode,
-    Session,
-    TermsOfService,
-    sent_code,
-    terms_of_service,
-)
-from .bots_and_keyboards import (
-    BotCommand,
-    BotCommandScope,
-    BotCommandScopeAllChatAdministrators,
-    BotCommandScopeAllGroupChats,
-    BotCommandScopeAllPrivateChats,
-    BotCommandScopeChat,
-    BotCommandScopeChatAdministrators,
-    BotCommandScopeChatMember,
-    BotCommandScopeDefault,
-    CallbackGame,
-    CallbackQuery,
-    ForceReply,
-    GameHighScore,
-    InlineKeyboardButton,
-    InlineKeyboardMarkup,
-    KeyboardButton,
-    LoginUrl,
-    MenuButton,
-    MenuButtonCommands,
-    MenuButtonDefault,
-    MenuButtonWebApp,
-    ReplyKeyboardMarkup,
-    ReplyKeyboardRemove,
-    SentWebAppMessage,
-    WebAppInfo,
-    bot_command,
-    bot_command_scope,
-    bot_command_scope_all_chat_administrators,
-    bot_command_scope_all_group_chats,
-    bot_command_scope_all_private_chats,
-    bot_command_scope_chat,
-    bot_command_scope_chat_administrators,
-    bot_command_scope_chat_member,
-    bot_command_scope_default,
-    callback_game,
-    callback_query,
-    force_reply,
-    game_high_score,
-    inline_keyboard_button,
-    inline_keyboard_markup,
-    keyboard_button,
-    login_url,
-    menu_button,
-    menu_button_commands,
-    menu_button_default,
-    menu_button_web_app,
-    reply_keyboard_markup,
-    reply_keyboard_remove,
-    sent_web_app_message,
-    web_app_info,
-)
-from .inline_mode import (
-    ChosenInlineResult,
-    InlineQuery,
-    InlineQueryResult,
-    InlineQueryResultAnimation,
-    InlineQueryResultArticle,
-    InlineQueryResultAudio,
-    InlineQueryResultCachedAnimation,
-    InlineQueryResultCachedAudio,
-    InlineQueryResultCachedDocument,
-    InlineQueryResultCachedPhoto,
-    InlineQueryResultCachedSticker,
-    InlineQueryResultCachedVideo,
-    InlineQueryResultCachedVoice,
-    InlineQueryResultContact,
-    InlineQueryResultDocument,
-    InlineQueryResultLocation,
-    InlineQueryResultPhoto,
-    InlineQueryResultVenue,
-    InlineQueryResultVideo,
-    InlineQueryResultVoice,
-    chosen_inline_result,
-    inline_query,
-    inline_query_result,
-    inline_query_result_animation,
-    inline_query_result_article,
-    inline_query_result_audio,
-    inline_query_result_cached_animation,
-    inline_query_result_cached_audio,
-    inline_query_result_cached_document,
-    inline_query_result_cached_photo,
-    inline_query_result_cached_sticker,
-    inline_query_result_cached_video,
-    inline_query_result_cached_voice,
-    inline_query_result_contact,
-    inline_query_result_document,
-    inline_query_result_location,
-    inline_query_result_photo,
-    inline_query_result_venue,
-    inline_query_result_video,
-    inline_query_result_voice,
-)
-from .input_media import (
-    InputMedia,
-    InputMediaAnimation,
-    InputMediaAudio,
-    InputMediaDocument,
-    InputMediaPhoto,
-    InputMediaVideo,
-    InputPhoneContact,
-    input_media,
-    input_media_animation,
-    input_media_audio,
-    input_media_document,
-    input_media_photo,
-    input_media_video,
-    input_phone_contact,
-)
-from .input_message_content import (
-    InputMessageContent,
-    InputPollOption,
-    InputTextMessageContent,
-    input_message_content,
-    input_poll_option,
-    input_text_message_content,
-)
-from .list import List
-from .messages_and_media import (
-    Animation,
-    Audio,
-    Contact,
-    Dice,
-    Document,
-    Game,
-    Location,
-    Message,
-    MessageEntity,
-    MessageReactions,
-    Photo,
-    Poll,
-    PollOption,
-    Reaction,
-    Sticker,
-    StrippedThumbnail,
-    Thumbnail,
-    Venue,
-    Video,
-    VideoNote,
-    Voice,
-    WebAppData,
-    WebPage,
-    animation,
-    audio,
-    contact,
-    dice,
-    document,
-    game,
-    location,
-    message,
-    message_entity,
-    message_reactions,
-    photo,
-    poll,
-    poll_option,
-    reaction,
-    sticker,
-    stripped_thumbnail,
-    thumbnail,
-    venue,
-    video,
-    video_note,
-    voice,
-    web_app_data,
-    web_page,
-)
-from .object import Object
-from .pyromod import Identifier, Listener, ListenerTypes
-from .update import Update
-from .user_and_chats import (
-    Chat,
-    ChatAdminWithInviteLinks,
-    ChatEvent,
-    ChatEventFilter,
-    ChatInviteLink,
-    ChatJoiner,
-    ChatJoinRequest,
-    ChatMember,
-    ChatMemberUpdated,
-    ChatPermissions,
-    ChatPhoto,
-    ChatPreview,
-    ChatPrivileges,
-    ChatReactions,
-    Dialog,
-    EmojiStatus,
-    ForumTopic,
-    ForumTopicClosed,
-    ForumTopicCreated,
-    ForumTopicEdited,
-    ForumTopicReopened,
-    GeneralTopicHidden,
-    GeneralTopicUnhidden,
-    InviteLinkImporter,
-    PeerChannel,
-    PeerUser,
-    Restriction,
-    User,
-    Username,
-    VideoChatEnded,
-    VideoChatMembersInvited,
-    VideoChatScheduled,
-    VideoChatStarted,
-    chat,
-    chat_admin_with_invite_links,
-    chat_event,
-    chat_event_filter,
-    chat_invite_link,
-    chat_join_request,
-    chat_joiner,
-    chat_member,
-    chat_member_updated,
-    chat_permissions,
-    chat_photo,
-    chat_preview,
-    chat_privileges,
-    chat_reactions,
-    dialog,
-    emoji_status,
-    invite_link_importer,
-    restriction,
-    user,
-    video_chat_ended,
-    video_chat_members_invited,
-    video_chat_scheduled,
-    video_chat_started,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from .authorization import (
+        SentCode as SentCode,
+    )
+    from .authorization import (
+        Session as Session,
+    )
+    from .authorization import (
+        TermsOfService as TermsOfService,
+    )
+    from .authorization import (
+        sent_code as sent_code,
+    )
+    from .authorization import (
+        terms_of_service as terms_of_service,
+    )
+    from .bots_and_keyboards import (
+        BotCommand as BotCommand,
+    )
+    from .bots_and_keyboards import (
+        BotCommandScope as BotCommandScope,
+    )
+    from .bots_and_keyboards import (
+        BotCommandScopeAllChatAdministrators as BotCommandScopeAllChatAdministrators,
+    )
+    from .bots_and_keyboards import (
+        BotCommandScopeAllGroupChats as BotCommandScopeAllGroupChats,
+    )
+    from .bots_and_keyboards import (
+        BotCommandScopeAllPrivateChats as BotCommandScopeAllPrivateChats,
+    )
+    from .bots_and_keyboards import (
+        BotCommandScopeChat as BotCommandScopeChat,
+    )
+    from .bots_and_keyboards import (
+        BotCommandScopeChatAdministrators as BotCommandScopeChatAdministrators,
+    )
+    from .bots_and_keyboards import (
+        BotCommandScopeChatMember as BotCommandScopeChatMember,
+    )
+    from .bots_and_keyboards import (
+        BotCommandScopeDefault as BotCommandScopeDefault,
+    )
+    from .bots_and_keyboards import (
+        CallbackGame as CallbackGame,
+    )
+    from .bots_and_keyboards import (
+        CallbackQuery as CallbackQuery,
+    )
+    from .bots_and_keyboards import (
+        ForceReply as ForceReply,
+    )
+    from .bots_and_keyboards import (
+        GameHighScore as GameHighScore,
+    )
+    from .bots_and_keyboards import (
+        InlineKeyboardButton as InlineKeyboardButton,
+    )
+    from .bots_and_keyboards import (
+        InlineKeyboardMarkup as InlineKeyboardMarkup,
+    )
+    from .bots_and_keyboards import (
+        KeyboardButton as KeyboardButton,
+    )
+    from .bots_and_keyboards import (
+        LoginUrl as LoginUrl,
+    )
+    from .bots_and_keyboards import (
+        MenuButton as MenuButton,
+    )
+    from .bots_and_keyboards import (
+        MenuButtonCommands as MenuButtonCommands,
+    )
+    from .bots_and_keyboards import (
+        MenuButtonDefault as MenuButtonDefault,
+    )
+    from .bots_and_keyboards import (
+        MenuButtonWebApp as MenuButtonWebApp,
+    )
+    from .bots_and_keyboards import (
+        ReplyKeyboardMarkup as ReplyKeyboardMarkup,
+    )
+    from .bots_and_keyboards import (
+        ReplyKeyboardRemove as ReplyKeyboardRemove,
+    )
+    from .bots_and_keyboards import (
+        SentWebAppMessage as SentWebAppMessage,
+    )
+    from .bots_and_keyboards import (
+        WebAppInfo as WebAppInfo,
+    )
+    from .bots_and_keyboards import (
+        bot_command as bot_command,
+    )
+    from .bots_and_keyboards import (
+        bot_command_scope as bot_command_scope,
+    )
+    from .bots_and_keyboards import (
+        bot_command_scope_all_chat_administrators as bot_command_scope_all_chat_administrators,
+    )
+    from .bots_and_keyboards import (
+        bot_command_scope_all_group_chats as bot_command_scope_all_group_chats,
+    )
+    from .bots_and_keyboards import (
+        bot_command_scope_all_private_chats as bot_command_scope_all_private_chats,
+    )
+    from .bots_and_keyboards import (
+        bot_command_scope_chat as bot_command_scope_chat,
+    )
+    from .bots_and_keyboards import (
+        bot_command_scope_chat_administrators as bot_command_scope_chat_administrators,
+    )
+    from .bots_and_keyboards import (
+        bot_command_scope_chat_member as bot_command_scope_chat_member,
+    )
+    from .bots_and_keyboards import (
+        bot_command_scope_default as bot_command_scope_default,
+    )
+    from .bots_and_keyboards import (
+        callback_game as callback_game,
+    )
+    from .bots_and_keyboards import (
+        callback_query as callback_query,
+    )
+    from .bots_and_keyboards import (
+        force_reply as force_reply,
+    )
+    from .bots_and_keyboards import (
+        game_high_score as game_high_score,
+    )
+    from .bots_and_keyboards import (
+        inline_keyboard_button as inline_keyboard_button,
+    )
+    from .bots_and_keyboards import (
+        inline_keyboard_markup as inline_keyboard_markup,
+    )
+    from .bots_and_keyboards import (
+        keyboard_button as keyboard_button,
+    )
+    from .bots_and_keyboards import (
+        login_url as login_url,
+    )
+    from .bots_and_keyboards import (
+        menu_button as menu_button,
+    )
+    from .bots_and_keyboards import (
+        menu_button_commands as menu_button_commands,
+    )
+    from .bots_and_keyboards import (
+        menu_button_default as menu_button_default,
+    )
+    from .bots_and_keyboards import (
+        menu_button_web_app as menu_button_web_app,
+    )
+    from .bots_and_keyboards import (
+        reply_keyboard_markup as reply_keyboard_markup,
+    )
+    from .bots_and_keyboards import (
+        reply_keyboard_remove as reply_keyboard_remove,
+    )
+    from .bots_and_keyboards import (
+        sent_web_app_message as sent_web_app_message,
+    )
+    from .bots_and_keyboards import (
+        web_app_info as web_app_info,
+    )
+    from .inline_mode import (
+        ChosenInlineResult as ChosenInlineResult,
+    )
+    from .inline_mode import (
+        InlineQuery as InlineQuery,
+    )
+    from .inline_mode import (
+        InlineQueryResult as InlineQueryResult,
+    )
+    from .inline_mode import (
+        InlineQueryResultAnimation as InlineQueryResultAnimation,
+    )
+    from .inline_mode import (
+        InlineQueryResultArticle as InlineQueryResultArticle,
+    )
+    from .inline_mode import (
+        InlineQueryResultAudio as InlineQueryResultAudio,
+    )
+    from .inline_mode import (
+        InlineQueryResultCachedAnimation as InlineQueryResultCachedAnimation,
+    )
+    from .inline_mode import (
+        InlineQueryResultCachedAudio as InlineQueryResultCachedAudio,
+    )
+    from .inline_mode import (
+        InlineQueryResultCachedDocument as InlineQueryResultCachedDocument,
+    )
+    from .inline_mode import (
+        InlineQueryResultCachedPhoto as InlineQueryResultCachedPhoto,
+    )
+    from .inline_mode import (
+        InlineQueryResultCachedSticker as InlineQueryResultCachedSticker,
+    )
+    from .inline_mode import (
+        InlineQueryResultCachedVideo as InlineQueryResultCachedVideo,
+    )
+    from .inline_mode import (
+        InlineQueryResultCachedVoice as InlineQueryResultCachedVoice,
+    )
+    from .inline_mode import (
+        InlineQueryResultContact as InlineQueryResultContact,
+    )
+    from .inline_mode import (
+        InlineQueryResultDocument as InlineQueryResultDocument,
+    )
+    from .inline_mode import (
+        InlineQueryResultLocation as InlineQueryResultLocation,
+    )
+    from .inline_mode import (
+        InlineQueryResultPhoto as InlineQueryResultPhoto,
+    )
+    from .inline_mode import (
+        InlineQueryResultVenue as InlineQueryResultVenue,
+    )
+    from .inline_mode import (
+        InlineQueryResultVideo as InlineQueryResultVideo,
+    )
+    from .inline_mode import (
+        InlineQueryResultVoice as InlineQueryResultVoice,
+    )
+    from .inline_mode import (
+        chosen_inline_result as chosen_inline_result,
+    )
+    from .inline_mode import (
+        inline_query as inline_query,
+    )
+    from .inline_mode import (
+        inline_query_result as inline_query_result,
+    )
+    from .inline_mode import (
+        inline_query_result_animation as inline_query_result_animation,
+    )
+    from .inline_mode import (
+        inline_query_result_article as inline_query_result_article,
+    )
+    from .inline_mode import (
+        inline_query_result_audio as inline_query_result_audio,
+    )
+    from .inline_mode import (
+        inline_query_result_cached_animation as inline_query_result_cached_animation,
+    )
+    from .inline_mode import (
+        inline_query_result_cached_audio as inline_query_result_cached_audio,
+    )
+    from .inline_mode import (
+        inline_query_result_cached_document as inline_query_result_cached_document,
+    )
+    from .inline_mode import (
+        inline_query_result_cached_photo as inline_query_result_cached_photo,
+    )
+    from .inline_mode import (
+        inline_query_result_cached_sticker as inline_query_result_cached_sticker,
+    )
+    from .inline_mode import (
+        inline_query_result_cached_video as inline_query_result_cached_video,
+    )
+    from .inline_mode import (
+        inline_query_result_cached_voice as inline_query_result_cached_voice,
+    )
+    from .inline_mode import (
+        inline_query_result_contact as inline_query_result_contact,
+    )
+    from .inline_mode import (
+        inline_query_result_document as inline_query_result_document,
+    )
+    from .inline_mode import (
+        inline_query_result_location as inline_query_result_location,
+    )
+    from .inline_mode import (
+        inline_query_result_photo as inline_query_result_photo,
+    )
+    from .inline_mode import (
+        inline_query_result_venue as inline_query_result_venue,
+    )
+    from .inline_mode import (
+        inline_query_result_video as inline_query_result_video,
+    )
+    from .inline_mode import (
+        inline_query_result_voice as inline_query_result_voice,
+    )
+    from .input_media import (
+        InputMedia as InputMedia,
+    )
+    from .input_media import (
+        InputMediaAnimation as InputMediaAnimation,
+    )
+    from .input_media import (
+        InputMediaAudio as InputMediaAudio,
+    )
+    from .input_media import (
+        InputMediaDocument as InputMediaDocument,
+    )
+    from .input_media import (
+        InputMediaPhoto as InputMediaPhoto,
+    )
+    from .input_media import (
+        InputMediaVideo as InputMediaVideo,
+    )
+    from .input_media import (
+        InputPhoneContact as InputPhoneContact,
+    )
+    from .input_media import (
+        input_media as input_media,
+    )
+    from .input_media import (
+        input_media_animation as input_media_animation,
+    )
+    from .input_media import (
+        input_media_audio as input_media_audio,
+    )
+    from .input_media import (
+        input_media_document as input_media_document,
+    )
+    from .input_media import (
+        input_media_photo as input_media_photo,
+    )
+    from .input_media import (
+        input_media_video as input_media_video,
+    )
+    from .input_media import (
+        input_phone_contact as input_phone_contact,
+    )
+    from .input_message_content import (
+        InputMessageContent as InputMessageContent,
+    )
+    from .input_message_content import (
+        InputPollOption as InputPollOption,
+    )
+    from .input_message_content import (
+        InputTextMessageContent as InputTextMessageContent,
+    )
+    from .input_message_content import (
+        input_message_content as input_message_content,
+    )
+    from .input_message_content import (
+        input_poll_option as input_poll_option,
+    )
+    from .input_message_content import (
+        input_text_message_content as input_text_message_content,
+    )
+    from .list import (
+        List as List,
+    )
+    from .messages_and_media import (
+        Animation as Animation,
+    )
+    from .messages_and_media import (
+        Audio as Audio,
+    )
+    from .messages_and_media import (
+        Contact as Contact,
+    )
+    from .messages_and_media import (
+        Dice as Dice,
+    )
+    from .messages_and_media import (
+        Document as Document,
+    )
+    from .messages_and_media import (
+        Game as Game,
+    )
+    from .messages_and_media import (
+        Location as Location,
+    )
+    from .messages_and_media import (
+        Message as Message,
+    )
+    from .messages_and_media import (
+        MessageEntity as MessageEntity,
+    )
+    from .messages_and_media import (
+        MessageReactions as MessageReactions,
+    )
+    from .messages_and_media import (
+        Photo as Photo,
+    )
+    from .messages_and_media import (
+        Poll as Poll,
+    )
+    from .messages_and_media import (
+        PollOption as PollOption,
+    )
+    from .messages_and_media import (
+        Reaction as Reaction,
+    )
+    from .messages_and_media import (
+        Sticker as Sticker,
+    )
+    from .messages_and_media import (
+        StrippedThumbnail as StrippedThumbnail,
+    )
+    from .messages_and_media import (
+        Thumbnail as Thumbnail,
+    )
+    from .messages_and_media import (
+        Venue as Venue,
+    )
+    from .messages_and_media import (
+        Video as Video,
+    )
+    from .messages_and_media import (
+        VideoNote as VideoNote,
+    )
+    from .messages_and_media import (
+        Voice as Voice,
+    )
+    from .messages_and_media import (
+        WebAppData as WebAppData,
+    )
+    from .messages_and_media import (
+        WebPage as WebPage,
+    )
+    from .messages_and_media import (
+        animation as animation,
+    )
+    from .messages_and_media import (
+        audio as audio,
+    )
+    from .messages_and_media import (
+        contact as contact,
+    )
+    from .messages_and_media import (
+        dice as dice,
+    )
+    from .messages_and_media import (
+        document as document,
+    )
+    from .messages_and_media import (
+        game as game,
+    )
+    from .messages_and_media import (
+        location as location,
+    )
+    from .messages_and_media import (
+        message as message,
+    )
+    from .messages_and_media import (
+        message_entity as message_entity,
+    )
+    from .messages_and_media import (
+        message_reactions as message_reactions,
+    )
+    from .messages_and_media import (
+        photo as photo,
+    )
+    from .messages_and_media import (
+        poll as poll,
+    )
+    from .messages_and_media import (
+        poll_option as poll_option,
+    )
+    from .messages_and_media import (
+        reaction as reaction,
+    )
+    from .messages_and_media import (
+        sticker as sticker,
+    )
+    from .messages_and_media import (
+        stripped_thumbnail as stripped_thumbnail,
+    )
+    from .messages_and_media import (
+        thumbnail as thumbnail,
+    )
+    from .messages_and_media import (
+        venue as venue,
+    )
+    from .messages_and_media import (
+        video as video,
+    )
+    from .messages_and_media import (
+        video_note as video_note,
+    )
+    from .messages_and_media import (
+        voice as voice,
+    )
+    from .messages_and_media import (
+        web_app_data as web_app_data,
+    )
+    from .messages_and_media import (
+        web_page as web_page,
+    )
+    from .object import (
+        Object as Object,
+    )
+    from .pyromod import (
+        Identifier as Identifier,
+    )
+    from .pyromod import (
+        Listener as Listener,
+    )
+    from .pyromod import (
+        ListenerTypes as ListenerTypes,
+    )
+    from .update import (
+        Update as Update,
+    )
+    from .user_and_chats import (
+        Chat as Chat,
+    )
+    from .user_and_chats import (
+        ChatAdminWithInviteLinks as ChatAdminWithInviteLinks,
+    )
+    from .user_and_chats import (
+        ChatEvent as ChatEvent,
+    )
+    from .user_and_chats import (
+        ChatEventFilter as ChatEventFilter,
+    )
+    from .user_and_chats import (
+        ChatInviteLink as ChatInviteLink,
+    )
+    from .user_and_chats import (
+        ChatJoiner as ChatJoiner,
+    )
+    from .user_and_chats import (
+        ChatJoinRequest as ChatJoinRequest,
+    )
+    from .user_and_chats import (
+        ChatMember as ChatMember,
+    )
+    from .user_and_chats import (
+        ChatMemberUpdated as ChatMemberUpdated,
+    )
+    from .user_and_chats import (
+        ChatPermissions as ChatPermissions,
+    )
+    from .user_and_chats import (
+        ChatPhoto as ChatPhoto,
+    )
+    from .user_and_chats import (
+        ChatPreview as ChatPreview,
+    )
+    from .user_and_chats import (
+        ChatPrivileges as ChatPrivileges,
+    )
+    from .user_and_chats import (
+        ChatReactions as ChatReactions,
+    )
+    from .user_and_chats import (
+        Dialog as Dialog,
+    )
+    from .user_and_chats import (
+        EmojiStatus as EmojiStatus,
+    )
+    from .user_and_chats import (
+        ForumTopic as ForumTopic,
+    )
+    from .user_and_chats import (
+        ForumTopicClosed as ForumTopicClosed,
+    )
+    from .user_and_chats import (
+        ForumTopicCreated as ForumTopicCreated,
+    )
+    from .user_and_chats import (
+        ForumTopicEdited as ForumTopicEdited,
+    )
+    from .user_and_chats import (
+        ForumTopicReopened as ForumTopicReopened,
+    )
+    from .user_and_chats import (
+        GeneralTopicHidden as GeneralTopicHidden,
+    )
+    from .user_and_chats import (
+        GeneralTopicUnhidden as GeneralTopicUnhidden,
+    )
+    from .user_and_chats import (
+        InviteLinkImporter as InviteLinkImporter,
+    )
+    from .user_and_chats import (
+        PeerChannel as PeerChannel,
+    )
+    from .user_and_chats import (
+        PeerUser as PeerUser,
+    )
+    from .user_and_chats import (
+        Restriction as Restriction,
+    )
+    from .user_and_chats import (
+        User as User,
+    )
+    from .user_and_chats import (
+        Username as Username,
+    )
+    from .user_and_chats import (
+        VideoChatEnded as VideoChatEnded,
+    )
+    from .user_and_chats import (
+        VideoChatMembersInvited as VideoChatMembersInvited,
+    )
+    from .user_and_chats import (
+        VideoChatScheduled as VideoChatScheduled,
+    )
+    from .user_and_chats import (
+        VideoChatStarted as VideoChatStarted,
+    )
+    from .user_and_chats import (
+        chat as chat,
+    )
+    from .user_and_chats import (
+        chat_admin_with_invite_links as chat_admin_with_invite_links,
+    )
+    from .user_and_chats import (
+        chat_event as chat_event,
+    )
+    from .user_and_chats import (
+        chat_event_filter as chat_event_filter,
+    )
+    from .user_and_chats import (
+        chat_invite_link as chat_invite_link,
+    )
+    from .user_and_chats import (
+        chat_join_request as chat_join_request,
+    )
+    from .user_and_chats import (
+        chat_joiner as chat_joiner,
+    )
+    from .user_and_chats import (
+        chat_member as chat_member,
+    )
+    from .user_and_chats import (
+        chat_member_updated as chat_member_updated,
+    )
+    from .user_and_chats import (
+        chat_permissions as chat_permissions,
+    )
+    from .user_and_chats import (
+        chat_photo as chat_photo,
+    )
+    from .user_and_chats import (
+        chat_preview as chat_preview,
+    )
+    from .user_and_chats import (
+        chat_privileges as chat_privileges,
+    )
+    from .user_and_chats import (
+        chat_reactions as chat_reactions,
+    )
+    from .user_and_chats import (
+        dialog as dialog,
+    )
+    from .user_and_chats import (
+        emoji_status as emoji_status,
+    )
+    from .user_and_chats import (
+        invite_link_importer as invite_link_importer,
+    )
+    from .user_and_chats import (
+        restriction as restriction,
+    )
+    from .user_and_chats import (
+        user as user,
+    )
+    from .user_and_chats import (
+        video_chat_ended as video_chat_ended,
+    )
+    from .user_and_chats import (
+        video_chat_members_invited as video_chat_members_invited,
+    )
+    from .user_and_chats import (
+        video_chat_scheduled as video_chat_scheduled,
+    )
+    from .user_and_chats import (
+        video_chat_started as video_chat_started,
+    )
+
+# Maps every exported name to the submodule that defines it, so the types
+# package can be imported without eagerly loading all of them (PEP 562).
+_LAZY = {
+    "Animation": ".messages_and_media",
+    "Audio": ".messages_and_media",
+    "BotCommand": ".bots_and_keyboards",
+    "BotCommandScope": ".bots_and_keyboards",
+    "BotCommandScopeAllChatAdministrators": ".bots_and_keyboards",
+    "BotCommandScopeAllGroupChats": ".bots_and_keyboards",
+    "BotCommandScopeAllPrivateChats": ".bots_and_keyboards",
+    "BotCommandScopeChat": ".bots_and_keyboards",
+    "BotCommandScopeChatAdministrators": ".bots_and_keyboards",
+    "BotCommandScopeChatMember": ".bots_and_keyboards",
+    "BotCommandScopeDefault": ".bots_and_keyboards",
+    "CallbackGame": ".bots_and_keyboards",
+    "CallbackQuery": ".bots_and_keyboards",
+    "Chat": ".user_and_chats",
+    "ChatAdminWithInviteLinks": ".user_and_chats",
+    "ChatEvent": ".user_and_chats",
+    "ChatEventFilter": ".user_and_chats",
+    "ChatInviteLink": ".user_and_chats",
+    "ChatJoinRequest": ".user_and_chats",
+    "ChatJoiner": ".user_and_chats",
+    "ChatMember": ".user_and_chats",
+    "ChatMemberUpdated": ".user_and_chats",
+    "ChatPermissions": ".user_and_chats",
+    "ChatPhoto": ".user_and_chats",
+    "ChatPreview": ".user_and_chats",
+    "ChatPrivileges": ".user_and_chats",
+    "ChatReactions": ".user_and_chats",
+    "ChosenInlineResult": ".inline_mode",
+    "Contact": ".messages_and_media",
+    "Dialog": ".user_and_chats",
+    "Dice": ".messages_and_media",
+    "Document": ".messages_and_media",
+    "EmojiStatus": ".user_and_chats",
+    "ForceReply": ".bots_and_keyboards",
+    "ForumTopic": ".user_and_chats",
+    "ForumTopicClosed": ".user_and_chats",
+    "ForumTopicCreated": ".user_and_chats",
+    "ForumTopicEdited": ".user_and_chats",
+    "ForumTopicReopened": ".user_and_chats",
+    "Game": ".messages_and_media",
+    "GameHighScore": ".bots_and_keyboards",
+    "GeneralTopicHidden": ".user_and_chats",
+    "GeneralTopicUnhidden": ".user_and_chats",
+    "Identifier": ".pyromod",
+    "InlineKeyboardButton": ".bots_and_keyboards",
+    "InlineKeyboardMarkup": ".bots_and_keyboards",
+    "InlineQuery": ".inline_mode",
+    "InlineQueryResult": ".inline_mode",
+    "InlineQueryResultAnimation": ".inline_mode",
+    "InlineQueryResultArticle": ".inline_mode",
+    "InlineQueryResultAudio": ".inline_mode",
+    "InlineQueryResultCachedAnimation": ".inline_mode",
+    "InlineQueryResultCachedAudio": ".inline_mode",
+    "InlineQueryResultCachedDocument": ".inline_mode",
+    "InlineQueryResultCachedPhoto": ".inline_mode",
+    "InlineQueryResultCachedSticker": ".inline_mode",
+    "InlineQueryResultCachedVideo": ".inline_mode",
+    "InlineQueryResultCachedVoice": ".inline_mode",
+    "InlineQueryResultContact": ".inline_mode",
+    "InlineQueryResultDocument": ".inline_mode",
+    "InlineQueryResultLocation": ".inline_mode",
+    "InlineQueryResultPhoto": ".inline_mode",
+    "InlineQueryResultVenue": ".inline_mode",
+    "InlineQueryResultVideo": ".inline_mode",
+    "InlineQueryResultVoice": ".inline_mode",
+    "InputMedia": ".input_media",
+    "InputMediaAnimation": ".input_media",
+    "InputMediaAudio": ".input_media",
+    "InputMediaDocument": ".input_media",
+    "InputMediaPhoto": ".input_media",
+    "InputMediaVideo": ".input_media",
+    "InputMessageContent": ".input_message_content",
+    "InputPhoneContact": ".input_media",
+    "InputPollOption": ".input_message_content",
+    "InputTextMessageContent": ".input_message_content",
+    "InviteLinkImporter": ".user_and_chats",
+    "KeyboardButton": ".bots_and_keyboards",
+    "List": ".list",
+    "Listener": ".pyromod",
+    "ListenerTypes": ".pyromod",
+    "Location": ".messages_and_media",
+    "LoginUrl": ".bots_and_keyboards",
+    "MenuButton": ".bots_and_keyboards",
+    "MenuButtonCommands": ".bots_and_keyboards",
+    "MenuButtonDefault": ".bots_and_keyboards",
+    "MenuButtonWebApp": ".bots_and_keyboards",
+    "Message": ".messages_and_media",
+    "MessageEntity": ".messages_and_media",
+    "MessageReactions": ".messages_and_media",
+    "Object": ".object",
+    "PeerChannel": ".user_and_chats",
+    "PeerUser": ".user_and_chats",
+    "Photo": ".messages_and_media",
+    "Poll": ".messages_and_media",
+    "PollOption": ".messages_and_media",
+    "Reaction": ".messages_and_media",
+    "ReplyKeyboardMarkup": ".bots_and_keyboards",
+    "ReplyKeyboardRemove": ".bots_and_keyboards",
+    "Restriction": ".user_and_chats",
+    "SentCode": ".authorization",
+    "SentWebAppMessage": ".bots_and_keyboards",
+    "Session": ".authorization",
+    "Sticker": ".messages_and_media",
+    "StrippedThumbnail": ".messages_and_media",
+    "TermsOfService": ".authorization",
+    "Thumbnail": ".messages_and_media",
+    "Update": ".update",
+    "User": ".user_and_chats",
+    "Username": ".user_and_chats",
+    "Venue": ".messages_and_media",
+    "Video": ".messages_and_media",
+    "VideoChatEnded": ".user_and_chats",
+    "VideoChatMembersInvited": ".user_and_chats",
+    "VideoChatScheduled": ".user_and_chats",
+    "VideoChatStarted": ".user_and_chats",
+    "VideoNote": ".messages_and_media",
+    "Voice": ".messages_and_media",
+    "WebAppData": ".messages_and_media",
+    "WebAppInfo": ".bots_and_keyboards",
+    "WebPage": ".messages_and_media",
+    "animation": ".messages_and_media",
+    "audio": ".messages_and_media",
+    "bot_command": ".bots_and_keyboards",
+    "bot_command_scope": ".bots_and_keyboards",
+    "bot_command_scope_all_chat_administrators": ".bots_and_keyboards",
+    "bot_command_scope_all_group_chats": ".bots_and_keyboards",
+    "bot_command_scope_all_private_chats": ".bots_and_keyboards",
+    "bot_command_scope_chat": ".bots_and_keyboards",
+    "bot_command_scope_chat_administrators": ".bots_and_keyboards",
+    "bot_command_scope_chat_member": ".bots_and_keyboards",
+    "bot_command_scope_default": ".bots_and_keyboards",
+    "callback_game": ".bots_and_keyboards",
+    "callback_query": ".bots_and_keyboards",
+    "chat": ".user_and_chats",
+    "chat_admin_with_invite_links": ".user_and_chats",
+    "chat_event": ".user_and_chats",
+    "chat_event_filter": ".user_and_chats",
+    "chat_invite_link": ".user_and_chats",
+    "chat_join_request": ".user_and_chats",
+    "chat_joiner": ".user_and_chats",
+    "chat_member": ".user_and_chats",
+    "chat_member_updated": ".user_and_chats",
+    "chat_permissions": ".user_and_chats",
+    "chat_photo": ".user_and_chats",
+    "chat_preview": ".user_and_chats",
+    "chat_privileges": ".user_and_chats",
+    "chat_reactions": ".user_and_chats",
+    "chosen_inline_result": ".inline_mode",
+    "contact": ".messages_and_media",
+    "dialog": ".user_and_chats",
+    "dice": ".messages_and_media",
+    "document": ".messages_and_media",
+    "emoji_status": ".user_and_chats",
+    "force_reply": ".bots_and_keyboards",
+    "game": ".messages_and_media",
+    "game_high_score": ".bots_and_keyboards",
+    "inline_keyboard_button": ".bots_and_keyboards",
+    "inline_keyboard_markup": ".bots_and_keyboards",
+    "inline_query": ".inline_mode",
+    "inline_query_result": ".inline_mode",
+    "inline_query_result_animation": ".inline_mode",
+    "inline_query_result_article": ".inline_mode",
+    "inline_query_result_audio": ".inline_mode",
+    "inline_query_result_cached_animation": ".inline_mode",
+    "inline_query_result_cached_audio": ".inline_mode",
+    "inline_query_result_cached_document": ".inline_mode",
+    "inline_query_result_cached_photo": ".inline_mode",
+    "inline_query_result_cached_sticker": ".inline_mode",
+    "inline_query_result_cached_video": ".inline_mode",
+    "inline_query_result_cached_voice": ".inline_mode",
+    "inline_query_result_contact": ".inline_mode",
+    "inline_query_result_document": ".inline_mode",
+    "inline_query_result_location": ".inline_mode",
+    "inline_query_result_photo": ".inline_mode",
+    "inline_query_result_venue": ".inline_mode",
+    "inline_query_result_video": ".inline_mode",
+    "inline_query_result_voice": ".inline_mode",
+    "input_media": ".input_media",
+    "input_media_animation": ".input_media",
+    "input_media_audio": ".input_media",
+    "input_media_document": ".input_media",
+    "input_media_photo": ".input_media",
+    "input_media_video": ".input_media",
+    "input_message_content": ".input_message_content",
+    "input_phone_contact": ".input_media",
+    "input_poll_option": ".input_message_content",
+    "input_text_message_content": ".input_message_content",
+    "invite_link_importer": ".user_and_chats",
+    "keyboard_button": ".bots_and_keyboards",
+    "location": ".messages_and_media",
+    "login_url": ".bots_and_keyboards",
+    "menu_button": ".bots_and_keyboards",
+    "menu_button_commands": ".bots_and_keyboards",
+    "menu_button_default": ".bots_and_keyboards",
+    "menu_button_web_app": ".bots_and_keyboards",
+    "message": ".messages_and_media",
+    "message_entity": ".messages_and_media",
+    "message_reactions": ".messages_and_media",
+    "photo": ".messages_and_media",
+    "poll": ".messages_and_media",
+    "poll_option": ".messages_and_media",
+    "reaction": ".messages_and_media",
+    "reply_keyboard_markup": ".bots_and_keyboards",
+    "reply_keyboard_remove": ".bots_and_keyboards",
+    "restriction": ".user_and_chats",
+    "sent_code": ".authorization",
+    "sent_web_app_message": ".bots_and_keyboards",
+    "sticker": ".messages_and_media",
+    "stripped_thumbnail": ".messages_and_media",
+    "terms_of_service": ".authorization",
+    "thumbnail": ".messages_and_media",
+    "user": ".user_and_chats",
+    "venue": ".messages_and_media",
+    "video": ".messages_and_media",
+    "video_chat_ended": ".user_and_chats",
+    "video_chat_members_invited": ".user_and_chats",
+    "video_chat_scheduled": ".user_and_chats",
+    "video_chat_started": ".user_and_chats",
+    "video_note": ".messages_and_media",
+    "voice": ".messages_and_media",
+    "web_app_data": ".messages_and_media",
+    "web_app_info": ".bots_and_keyboards",
+    "web_page": ".messages_and_media",
+}
+
+# Generated from the lazy-import table (sorted(_LAZY)): keep both in sync so
+# every name appears exactly once and ruff can see the re-exports.
 __all__ = [
     "Animation",
     "Audio",
@@ -332,7 +1000,6 @@ __all__ = [
     "InviteLinkImporter",
     "KeyboardButton",
     "List",
-    "List",
     "Listener",
     "ListenerTypes",
     "Location",
@@ -479,3 +1146,21 @@ __all__ = [
     "web_app_info",
     "web_page",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module, __name__), name)
+
+    # Cache on the package so subsequent accesses skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    # __all__ is already sorted and unique, so no scan over globals() is needed.
+    return __all__
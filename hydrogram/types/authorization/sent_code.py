@@ -22,6 +22,11 @@ from __future__ import annotations
 from hydrogram import enums, raw
 from hydrogram.types.object import Object
 
+# Map raw types straight to enum members: a plain dict lookup per parse instead
+# of going through the Enum metaclass value-lookup machinery.
+_SENT_CODE_TYPE_MAP = {member.value: member for member in enums.SentCodeType}
+_NEXT_CODE_TYPE_MAP = {member.value: member for member in enums.NextCodeType}
+
 
 class SentCode(Object):
     """Contains info on a sent confirmation code.
@@ -41,6 +46,8 @@ class SentCode(Object):
             Delay in seconds before calling :meth:`~hydrogram.Client.resend_code`.
     """
 
+    __slots__ = ("next_type", "phone_code_hash", "timeout", "type")
+
     def __init__(
         self,
         *,
@@ -59,9 +66,9 @@ class SentCode(Object):
     @staticmethod
     def _parse(sent_code: raw.types.auth.SentCode) -> SentCode:
         return SentCode(
-            type=enums.SentCodeType(type(sent_code.type)),
+            type=_SENT_CODE_TYPE_MAP[type(sent_code.type)],
             phone_code_hash=sent_code.phone_code_hash,
-            next_type=enums.NextCodeType(type(sent_code.next_type))
+            next_type=_NEXT_CODE_TYPE_MAP[type(sent_code.next_type)]
             if sent_code.next_type
             else None,
             timeout=sent_code.timeout,
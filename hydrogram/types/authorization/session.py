@@ -85,6 +85,27 @@ class Session(Object):
             Whether the authorization is confirmed.
     """
 
+    __slots__ = (
+        "accepts_calls",
+        "accepts_secret_chats",
+        "api_id",
+        "app_name",
+        "app_version",
+        "country",
+        "date_active",
+        "date_created",
+        "device_model",
+        "id",
+        "ip",
+        "is_confirmed",
+        "is_current",
+        "is_official_app",
+        "is_password_pending",
+        "platform",
+        "region",
+        "system_version",
+    )
+
     def __init__(
         self,
         *,
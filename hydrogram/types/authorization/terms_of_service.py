@@ -36,6 +36,8 @@ class TermsOfService(Object):
             Special entities like URLs that appear in the text.
     """
 
+    __slots__ = ("entities", "id", "text")
+
     def __init__(self, *, id: str, text: str, entities: list["types.MessageEntity"]):
         super().__init__()
 
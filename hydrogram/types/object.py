@@ -26,7 +26,27 @@ if typing.TYPE_CHECKING:
     import hydrogram
 
 
+def _attr_names(obj):
+    """Yield the names of an instance's data attributes.
+
+    Works both for regular subclasses, which keep their attributes in
+    ``__dict__``, and for slotted ones, which declare them in ``__slots__``.
+    The internal client reference is never yielded.
+    """
+    instance_dict = getattr(obj, "__dict__", None)
+
+    if instance_dict is not None:
+        yield from instance_dict
+
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name not in {"_client", "__weakref__", "__dict__"}:
+                yield name
+
+
 class Object:
+    __slots__ = ("__weakref__", "_client")
+
     def __init__(self, client: "hydrogram.Client" = None):
         self._client = client
 
@@ -40,8 +60,8 @@ class Object:
         """
         self._client = client
 
-        for i in self.__dict__:
-            o = getattr(self, i)
+        for i in _attr_names(self):
+            o = getattr(self, i, None)
 
             if isinstance(o, Object):
                 o.bind(client)
@@ -66,8 +86,8 @@ class Object:
             "_": obj.__class__.__name__,
             **{
                 attr: ("*" * 9 if attr == "phone_number" else getattr(obj, attr))
-                for attr in filter(lambda x: not x.startswith("_"), obj.__dict__)
-                if getattr(obj, attr) is not None
+                for attr in filter(lambda x: not x.startswith("_"), _attr_names(obj))
+                if getattr(obj, attr, None) is not None
             },
         }
 
@@ -79,13 +99,13 @@ class Object:
             self.__class__.__name__,
             ", ".join(
                 f"{attr}={getattr(self, attr)!r}"
-                for attr in filter(lambda x: not x.startswith("_"), self.__dict__)
-                if getattr(self, attr) is not None
+                for attr in filter(lambda x: not x.startswith("_"), _attr_names(self))
+                if getattr(self, attr, None) is not None
             ),
         )
 
     def __eq__(self, other: "Object") -> bool:
-        for attr in self.__dict__:
+        for attr in _attr_names(self):
             try:
                 if attr.startswith("_"):
                     continue
@@ -98,26 +118,29 @@ class Object:
         return True
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+        return hash(
+            tuple(sorted((attr, getattr(self, attr, None)) for attr in _attr_names(self)))
+        )
 
     def __setstate__(self, state):
-        for attr in state:
-            obj = state[attr]
+        self._client = None
 
+        for attr, obj in state.items():
             # Maybe a better alternative would be https://docs.python.org/3/library/inspect.html#inspect.signature
             if isinstance(obj, tuple) and len(obj) == 2 and obj[0] == "dt":
-                state[attr] = datetime.fromtimestamp(obj[1])
+                obj = datetime.fromtimestamp(obj[1])
 
-        self.__dict__ = state
+            setattr(self, attr, obj)
 
     def __getstate__(self):
-        state = self.__dict__.copy()
-        state.pop("_client", None)
+        state = {}
 
-        for attr in state:
-            obj = state[attr]
+        for attr in _attr_names(self):
+            obj = getattr(self, attr, None)
 
             if isinstance(obj, datetime):
-                state[attr] = ("dt", obj.timestamp())
+                obj = ("dt", obj.timestamp())
+
+            state[attr] = obj
 
         return state
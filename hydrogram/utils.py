@@ -138,6 +138,21 @@ async def parse_messages(
     return types.List(parsed_messages)
 
 
+async def iter_parse_messages(client, messages: raw.types.messages.Messages):
+    """Like :func:`parse_messages`, but yields each message as soon as it is
+    parsed instead of materializing the whole page first. Replies are never
+    fetched.
+    """
+    users = {i.id: i for i in messages.users}
+    chats = {i.id: i for i in messages.chats}
+    topics = {i.id: i for i in messages.topics} if hasattr(messages, "topics") else None
+
+    for message in messages.messages:
+        yield await types.Message._parse(
+            client=client, message=message, users=users, chats=chats, topics=topics, replies=0
+        )
+
+
 def parse_deleted_messages(client, update) -> list[types.Message]:
     messages = update.messages
     channel_id = getattr(update, "channel_id", None)
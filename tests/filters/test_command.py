@@ -124,6 +124,49 @@ def test_with_args():
     assert m.command == ["start", *list("ab"), "c     d"]
 
 
+def test_with_mention_case_sensitive():
+    f = filters.command("start", case_sensitive=True)
+
+    m = Message("/start@username")
+    assert f(c, m)
+
+    m = Message("/START@username")
+    assert not f(c, m)
+
+    m = Message("/start@another")
+    assert not f(c, m)
+
+
+def test_mixed_case_with_non_ascii_args():
+    f = filters.command("start")
+
+    m = Message("/StArT héllo wörld")
+    f(c, m)
+    assert m.command == ["start", "héllo", "wörld"]
+
+    m = Message("/StArT@UsErNaMe x")
+    f(c, m)
+    assert m.command == ["start", "x"]
+
+
+def test_case_fold_length_change():
+    f = filters.command("start")
+
+    # "İ".lower() is two characters long, so the lowercased text cannot be
+    # matched positionally against the original one
+    m = Message("/START İstanbul")
+    f(c, m)
+    assert m.command == ["start", "İstanbul"]
+
+
+def test_mention_with_quoted_args():
+    f = filters.command("start")
+
+    m = Message("/start@username   'a  b'   \"c d\"   e")
+    f(c, m)
+    assert m.command == ["start", "a  b", "c d", "e"]
+
+
 def test_caption():
     f = filters.command("start")
 